@@ -9,9 +9,9 @@ from pathlib import Path
 from p05_data_models.clean_wav_registry import (
     CleanWavRegistry, 
     DroneType, 
+    get_correction_count,
     normalize_drone_type
 )
-import warnings
 
 
 def demonstrate_drone_type_correction():
@@ -39,46 +39,44 @@ def demonstrate_drone_type_correction():
         description="Example registry showing drone type correction"
     )
     
-    # Capture warnings to show when corrections are made
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
-        
-        # This would normally add real WAV files, but for demo we'll skip the file check
-        print("   Adding entries with legacy 'membo' name...")
-        
-        # Note: In real usage, you'd have actual WAV files
-        # For demo purposes, we'll create a mock entry directly
-        from p05_data_models.clean_wav_registry import CleanWavEntry
-        import time
-        
-        # Create mock entries with the legacy misspelled name
-        mock_entries = [
-            {
-                "file_path": Path("C:/example/audio/data/drone1_membo.wav"),
-                "drone_type": "membo",  # Legacy misspelling
-                "file_size": 1024000,
-                "modified_time": time.time()
-            },
-            {
-                "file_path": Path("C:/example/audio/data/drone2_mambo.wav"),
-                "drone_type": "mambo",  # Correct spelling
-                "file_size": 1024000,
-                "modified_time": time.time()
-            }
-        ]
-        
-        # Add entries (this will trigger the correction)
-        for entry_data in mock_entries:
-            entry = CleanWavEntry(**entry_data)
-            registry.entries.append(entry)
-        
-        # Show any warnings that were generated
-        if w:
-            print("   Warnings generated:")
-            for warning in w:
-                print(f"     {warning.message}")
-        else:
-            print("   No warnings (all names were already correct)")
+    # Count corrections to show when they are made
+    corrections_before = get_correction_count()
+    
+    # This would normally add real WAV files, but for demo we'll skip the file check
+    print("   Adding entries with legacy 'membo' name...")
+    
+    # Note: In real usage, you'd have actual WAV files
+    # For demo purposes, we'll create a mock entry directly
+    from p05_data_models.clean_wav_registry import CleanWavEntry
+    import time
+    
+    # Create mock entries with the legacy misspelled name
+    mock_entries = [
+        {
+            "file_path": Path("C:/example/audio/data/drone1_membo.wav"),
+            "drone_type": "membo",  # Legacy misspelling
+            "file_size": 1024000,
+            "modified_time": time.time()
+        },
+        {
+            "file_path": Path("C:/example/audio/data/drone2_mambo.wav"),
+            "drone_type": "mambo",  # Correct spelling
+            "file_size": 1024000,
+            "modified_time": time.time()
+        }
+    ]
+    
+    # Add entries (this will trigger the correction)
+    for entry_data in mock_entries:
+        entry = CleanWavEntry(**entry_data)
+        registry.entries.append(entry)
+    
+    # Show any corrections that were made
+    correction_count = get_correction_count() - corrections_before
+    if correction_count:
+        print(f"   Corrections made: {correction_count}")
+    else:
+        print("   No corrections (all names were already correct)")
     
     print("\n3. Final registry contents:")
     counts = registry.count_by_drone_type
@@ -2,18 +2,22 @@
 
 from .clean_wav_registry import (
     CleanWavRegistry,
+    CleanWavRegistryColumnar,
     CleanWavEntry,
     RegistryHeader,
     DroneType,
     normalize_drone_type,
+    get_correction_count,
     LEGACY_DRONE_NAME_MAPPING
 )
 
 __all__ = [
     'CleanWavRegistry',
+    'CleanWavRegistryColumnar',
     'CleanWavEntry', 
     'RegistryHeader',
     'DroneType',
     'normalize_drone_type',
+    'get_correction_count',
     'LEGACY_DRONE_NAME_MAPPING'
 ]
\ No newline at end of file
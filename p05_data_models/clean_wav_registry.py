@@ -6,13 +6,18 @@ including their paths, drone types, and metadata about the registry creation.
 Includes automatic correction of misspelled drone names from legacy data.
 """
 
+from array import array
+from collections import Counter
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import List, Optional, Union
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import List, Optional, Tuple, Union
+import os
 import warnings
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator, ConfigDict
+from pydantic_core import from_json
 
 
 class DroneType(str, Enum):
@@ -28,6 +33,15 @@ LEGACY_DRONE_NAME_MAPPING = {
     "bebop": DroneType.BEBOP,  # Already correct
 }
 
+# Every accepted (lowercase) drone type spelling: the enum values plus legacy names
+_DRONE_TYPE_ALIASES = {
+    **{drone_type.value: drone_type for drone_type in DroneType},
+    **LEGACY_DRONE_NAME_MAPPING,
+}
+
+# Number of legacy misspellings corrected by normalize_drone_type in this process
+_correction_count = 0
+
 
 def normalize_drone_type(value: Union[str, DroneType]) -> DroneType:
     """
@@ -42,41 +56,64 @@ def normalize_drone_type(value: Union[str, DroneType]) -> DroneType:
     Raises:
         ValueError: If the drone type is not recognized
     """
+    global _correction_count
+    
     if isinstance(value, DroneType):
         return value
     
-    # Convert to lowercase for case-insensitive matching
-    normalized_value = value.lower().strip()
+    corrected_type, is_legacy = _normalize_cached(value)
     
-    if normalized_value in LEGACY_DRONE_NAME_MAPPING:
-        corrected_type = LEGACY_DRONE_NAME_MAPPING[normalized_value]
-        
-        # Warn if we're correcting a legacy misspelling
-        if normalized_value == "membo":
+    # Count every legacy misspelling correction, but only warn on the first one;
+    # get_correction_count() reports the total
+    if is_legacy:
+        _correction_count += 1
+        if _correction_count == 1:
             warnings.warn(
                 f"Correcting legacy drone type '{value}' to '{corrected_type.value}'. "
                 "The original dataset contained a misspelling.",
                 UserWarning,
                 stacklevel=3
             )
-        
-        return corrected_type
     
-    # Try direct enum lookup as fallback
-    try:
-        return DroneType(normalized_value)
-    except ValueError:
+    return corrected_type
+
+
+def get_correction_count() -> int:
+    """
+    Get the number of legacy drone type misspellings corrected so far.
+    
+    The count covers every normalize_drone_type call in this process; take the
+    difference between two readings to count the corrections made in between.
+    """
+    return _correction_count
+
+
+@lru_cache(maxsize=32)
+def _normalize_cached(value: str) -> Tuple[DroneType, bool]:
+    """
+    Resolve a raw drone type string, memoized per distinct input.
+    
+    Returns:
+        Tuple of the corrected DroneType and whether a legacy misspelling was corrected
+    """
+    # Convert to lowercase for case-insensitive matching
+    normalized_value = value.lower().strip()
+    
+    corrected_type = _DRONE_TYPE_ALIASES.get(normalized_value)
+    if corrected_type is None:
         raise ValueError(
             f"Unknown drone type: '{value}'. "
             f"Supported types: {list(LEGACY_DRONE_NAME_MAPPING.keys())}"
         )
+    
+    return corrected_type, normalized_value != corrected_type.value
 
 
 class CleanWavEntry(BaseModel):
     """Represents a single entry in the clean WAV registry."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True, extra='forbid')
     
-    file_path: Path = Field(..., description="Absolute path to the WAV file")
+    file_path: PurePath = Field(..., description="Absolute path to the WAV file")
     drone_type: DroneType = Field(..., description="Type of drone in the recording")
     file_size: int = Field(..., description="Size of the file in bytes")
     modified_time: float = Field(..., description="Last modified timestamp of the file")
@@ -85,18 +122,26 @@ class CleanWavEntry(BaseModel):
     @field_validator('file_path', mode='before')
     @classmethod
     def validate_file_path(cls, v):
-        """Ensure file_path is always an absolute path for future reference."""
-        if isinstance(v, str):
-            path = Path(v)
-        elif isinstance(v, Path):
-            path = v
+        """
+        Ensure file_path is always an absolute path for future reference.
+        
+        The path is stored as a PurePath: entries are in-memory records, so
+        callers that need filesystem access wrap it with Path(entry.file_path).
+        """
+        if isinstance(v, (str, PurePath)):
+            path = PurePath(v)
         else:
             raise ValueError(f"file_path must be a string or Path object, got {type(v)}")
         
+        # Paths found by scanning an absolute root are already absolute; skip
+        # the per-entry resolve() syscalls unless there is something to resolve
+        if path.is_absolute() and '..' not in path.parts:
+            return path
+        
         # Convert to absolute path and resolve any symbolic links
-        absolute_path = path.expanduser().resolve()
+        absolute_path = Path(path).expanduser().resolve()
         
-        return absolute_path
+        return PurePath(absolute_path)
     
     @field_validator('drone_type', mode='before')
     @classmethod
@@ -107,7 +152,7 @@ class CleanWavEntry(BaseModel):
 
 class RegistryHeader(BaseModel):
     """Metadata about the registry creation."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True, extra='forbid')
     
     created_by: str = Field(..., description="Script that generated this registry")
     created_at: datetime = Field(default_factory=datetime.now, description="When the registry was created")
@@ -140,32 +185,41 @@ class CleanWavRegistry(BaseModel):
     @property
     def count_by_drone_type(self) -> dict[DroneType, int]:
         """Count entries by drone type."""
-        from collections import defaultdict
-        counts = defaultdict(int)
-        for entry in self.entries:
-            counts[entry.drone_type] += 1
-        return dict(counts)
+        return dict(Counter(entry.drone_type for entry in self.entries))
 
-    def add_entry(self, file_path: Path, drone_type: Union[str, DroneType]) -> None:
+    def add_entry(
+        self,
+        file_path: Path,
+        drone_type: Union[str, DroneType],
+        stat_result: Optional[os.stat_result] = None
+    ) -> None:
         """
         Add a new entry to the registry.
         
         Args:
             file_path: Path to the WAV file
             drone_type: Type of drone (will be normalized to correct any misspellings)
+            stat_result: Optional stat result already obtained for the file (e.g. from
+                         os.scandir). When given, the file is not stat'ed again.
+            
+        Raises:
+            FileNotFoundError: If the WAV file does not exist. As with Path.exists(),
+                               other OS errors (e.g. PermissionError) propagate.
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"WAV file not found: {file_path}")
+        if stat_result is None:
+            try:
+                stat_result = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                raise FileNotFoundError(f"WAV file not found: {file_path}") from None
             
         # Normalize drone type to handle legacy misspellings
         normalized_drone_type = normalize_drone_type(drone_type)
         
-        stat = file_path.stat()
         self.entries.append(CleanWavEntry(
             file_path=file_path,
             drone_type=normalized_drone_type,
-            file_size=stat.st_size,
-            modified_time=stat.st_mtime
+            file_size=stat_result.st_size,
+            modified_time=stat_result.st_mtime
         ))
 
     @classmethod
@@ -173,7 +227,7 @@ class CleanWavRegistry(BaseModel):
         cls,
         created_by: str,
         filter_terms: List[str],
-        root_dir: Path,
+        root_dir: Union[str, Path],
         description: str = "Clean WAV file registry"
     ) -> 'CleanWavRegistry':
         """Create a new registry with the given metadata."""
@@ -181,7 +235,7 @@ class CleanWavRegistry(BaseModel):
             header=RegistryHeader(
                 created_by=created_by,
                 filter_terms=filter_terms,
-                root_dir=root_dir,
+                root_dir=Path(root_dir),
                 description=description
             )
         )
@@ -189,23 +243,22 @@ class CleanWavRegistry(BaseModel):
     def save_to_file(self, file_path: Path) -> None:
         """Save the registry to a JSON file."""
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
-            # Convert Path objects to strings for JSON serialization
-            data = self.model_dump(mode='json')
-            # Convert Path objects in the dumped data
-            data['header']['root_dir'] = str(self.header.root_dir)
-            for entry in data['entries']:
-                entry['file_path'] = str(Path(entry['file_path']))
-            
-            import json
-            f.write(json.dumps(data, indent=2))
+        # Stream one entry at a time rather than building the whole document in
+        # memory. The layout matches model_dump_json(indent=2); the nested JSON
+        # is re-indented by its depth (JSON strings never contain raw newlines).
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('{\n  "header": ')
+            f.write(self.header.model_dump_json(indent=2).replace('\n', '\n  '))
+            f.write(',\n  "entries": [')
+            for i, entry in enumerate(self.entries):
+                f.write(',\n    ' if i else '\n    ')
+                f.write(entry.model_dump_json(indent=2).replace('\n', '\n    '))
+            f.write('\n  ]\n}' if self.entries else ']\n}')
 
     @classmethod
     def load_from_file(cls, file_path: Path) -> 'CleanWavRegistry':
         """Load a registry from a JSON file."""
-        import json
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = from_json(file_path.read_bytes())
         
         # The field validators will automatically convert string paths back to Path objects
         return cls.model_validate(data)
@@ -230,11 +283,146 @@ class CleanWavRegistry(BaseModel):
         
         for i, entry in enumerate(self.entries):
             # Check if file still exists
-            if not entry.file_path.exists():
+            if not Path(entry.file_path).exists():
                 warnings_list.append(f"Entry {i}: File no longer exists: {entry.file_path}")
             
             # Check for reasonable file size (at least 1KB)
             if entry.file_size < 1024:
                 warnings_list.append(f"Entry {i}: Suspiciously small file size: {entry.file_size} bytes")
         
-        return warnings_list
\ No newline at end of file
+        return warnings_list
+
+
+# Compact integer codes for DroneType members, used by the columnar registry
+_DRONE_TYPES_BY_CODE = tuple(DroneType)
+_DRONE_TYPE_CODES = {drone_type: code for code, drone_type in enumerate(_DRONE_TYPES_BY_CODE)}
+
+# Array typecode of each numeric column in the columnar registry
+_COLUMN_TYPECODES = {
+    'drone_type_codes': 'b',
+    'file_sizes': 'q',
+    'modified_times': 'd',
+    'snr_db': 'd',
+}
+
+
+class CleanWavRegistryColumnar(BaseModel):
+    """
+    Column-oriented form of CleanWavRegistry for large registries.
+    
+    Each entry field is stored as one compact column (typed arrays for the
+    numeric fields) instead of one Pydantic object per file. Use
+    from_registry() / to_pydantic() to convert to and from CleanWavRegistry.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    header: RegistryHeader
+    file_paths: List[str] = Field(default_factory=list, description="Absolute paths to the WAV files")
+    drone_type_codes: array = Field(default_factory=lambda: array('b'), description="DroneType codes, in enum order")
+    file_sizes: array = Field(default_factory=lambda: array('q'), description="Sizes of the files in bytes")
+    modified_times: array = Field(default_factory=lambda: array('d'), description="Last modified timestamps of the files")
+    snr_db: array = Field(default_factory=lambda: array('d'), description="Signal-to-noise ratios in decibels")
+
+    @field_validator(*_COLUMN_TYPECODES, mode='before')
+    @classmethod
+    def validate_column(cls, v, info):
+        """Convert plain sequences (e.g. loaded from JSON) to a typed array."""
+        if isinstance(v, array):
+            return v
+        
+        typecode = _COLUMN_TYPECODES[info.field_name]
+        try:
+            return array(typecode, v)
+        except (TypeError, OverflowError) as e:
+            raise ValueError(
+                f"{info.field_name} values must fit array typecode '{typecode}': {e}"
+            ) from None
+    
+    @model_validator(mode='after')
+    def validate_columns(self) -> 'CleanWavRegistryColumnar':
+        """
+        Ensure every column has one value per file, of the expected type, and
+        that the values meet CleanWavEntry's invariants (to_pydantic relies on it).
+        """
+        for name, typecode in _COLUMN_TYPECODES.items():
+            column = getattr(self, name)
+            if column.typecode != typecode:
+                raise ValueError(
+                    f"{name} must be an array of typecode '{typecode}', got '{column.typecode}'"
+                )
+            if len(column) != len(self.file_paths):
+                raise ValueError(
+                    f"{name} has {len(column)} values, expected {len(self.file_paths)} "
+                    "(one per file path)"
+                )
+        
+        codes = self.drone_type_codes
+        if codes and not (0 <= min(codes) and max(codes) < len(_DRONE_TYPES_BY_CODE)):
+            raise ValueError(
+                f"drone_type_codes must be in range 0..{len(_DRONE_TYPES_BY_CODE) - 1}"
+            )
+        
+        # Paths must already be in the form CleanWavEntry stores: absolute, with
+        # nothing left to resolve
+        for i, file_path in enumerate(self.file_paths):
+            path = PurePath(file_path)
+            if not file_path or not path.is_absolute() or '..' in path.parts:
+                raise ValueError(
+                    f"file_paths[{i}] must be an absolute, resolved path, got {file_path!r}"
+                )
+        
+        if self.file_sizes and min(self.file_sizes) < 0:
+            raise ValueError("file_sizes must not be negative")
+        
+        return self
+    
+    @field_serializer(*_COLUMN_TYPECODES)
+    def serialize_column(self, column: array) -> list:
+        """Serialize typed arrays as plain lists."""
+        return column.tolist()
+
+    def __len__(self) -> int:
+        return len(self.file_paths)
+
+    @property
+    def count_by_drone_type(self) -> dict[DroneType, int]:
+        """Count entries by drone type."""
+        return {
+            _DRONE_TYPES_BY_CODE[code]: count
+            for code, count in Counter(self.drone_type_codes).items()
+        }
+
+    @classmethod
+    def from_registry(cls, registry: CleanWavRegistry) -> 'CleanWavRegistryColumnar':
+        """Build a columnar registry from a CleanWavRegistry."""
+        entries = registry.entries
+        return cls(
+            header=registry.header,
+            file_paths=[str(entry.file_path) for entry in entries],
+            drone_type_codes=array('b', [_DRONE_TYPE_CODES[entry.drone_type] for entry in entries]),
+            file_sizes=array('q', [entry.file_size for entry in entries]),
+            modified_times=array('d', [entry.modified_time for entry in entries]),
+            snr_db=array('d', [entry.snr_db for entry in entries])
+        )
+
+    def to_pydantic(self) -> CleanWavRegistry:
+        """Convert back to a CleanWavRegistry with one CleanWavEntry per file."""
+        # validate_columns has already checked the column data against the entry
+        # invariants, so the entries are built without per-entry validation
+        entries = [
+            CleanWavEntry.model_construct(
+                file_path=PurePath(file_path),
+                drone_type=_DRONE_TYPES_BY_CODE[code],
+                file_size=file_size,
+                modified_time=modified_time,
+                snr_db=snr_db
+            )
+            for file_path, code, file_size, modified_time, snr_db in zip(
+                self.file_paths,
+                self.drone_type_codes,
+                self.file_sizes,
+                self.modified_times,
+                self.snr_db
+            )
+        ]
+        return CleanWavRegistry(header=self.header, entries=entries)
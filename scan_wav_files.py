@@ -13,20 +13,29 @@ The script automatically corrects legacy misspellings (e.g., "membo" -> "mambo")
 """
 
 import os
-import yaml
+import re
 import sys
-from pathlib import Path
-from typing import List, Dict, Any, Set
-from datetime import datetime
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePath
+from typing import Iterator, List, Dict, Any, Optional, Set, Union
+from datetime import datetime
 
-from dotenv import load_dotenv
 from p05_data_models.clean_wav_registry import (
+    CleanWavEntry,
     CleanWavRegistry,
     DroneType,
+    get_correction_count,
     normalize_drone_type
 )
 
+# Filename tokens used to detect the drone type, in priority order
+_DRONE_TYPE_TOKENS = ('bebop', 'membo', 'mambo')
+
+# Relative frequency of filter terms in the drone audio dataset (higher = more
+# common), used to order the filter regex so typical paths match sooner
+_FILTER_TERM_FREQUENCY = {'bebop': 3, 'mambo': 2, 'membo': 1}
+
 
 def load_config(config_path: Path) -> Dict[str, Any]:
     """
@@ -42,6 +51,9 @@ def load_config(config_path: Path) -> Dict[str, Any]:
         FileNotFoundError: If the config file doesn't exist
         yaml.YAMLError: If there's an error parsing the YAML
     """
+    # Imported here so that importing this module doesn't pay for PyYAML
+    import yaml
+    
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
@@ -51,66 +63,173 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     return config
 
 
-def find_wav_files(root_dir: Path, filter_terms: List[str] = None) -> List[Path]:
+def _iter_wav_entries(directory: Union[str, os.PathLike[str]]) -> Iterator[os.DirEntry]:
     """
-    Recursively find WAV files in the specified directory, optionally filtered by terms.
+    Recursively yield directory entries for WAV files below a directory.
+    
+    Extensions are matched case-insensitively, and symlinked directories are
+    not followed (matching the behaviour of Path.rglob).
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_wav_entries(entry.path)
+                elif entry.name.lower().endswith('.wav'):
+                    yield entry
+    except PermissionError as e:
+        print(f"Warning: Skipping unreadable directory {directory}: {e}")
+
+
+def _list_wav_entries(directory: Union[str, os.PathLike[str]]) -> List[os.DirEntry]:
+    """Collect the WAV file entries below a directory into a list."""
+    return list(_iter_wav_entries(directory))
+
+
+def _scan_wav_entries(root_dir: Path, max_workers: Optional[int] = None) -> List[os.DirEntry]:
+    """
+    Walk root_dir for WAV files, scanning top-level subdirectories in parallel.
+    
+    Directory listing releases the GIL, so threads overlap the filesystem
+    latency (which dominates on network storage). Per-file stat() results are
+    not fetched here: on Windows scandir provides them for free, elsewhere
+    they are fetched later, only for the files that pass the filter. Results
+    are kept in directory listing order, so the output matches a serial walk.
+    
+    Args:
+        root_dir: Root directory to search in
+        max_workers: Number of scanner threads. Defaults to min(32, 4 * CPU count);
+                     1 or less scans serially.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    if max_workers <= 1:
+        return _list_wav_entries(root_dir)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: List[Union[Future, os.DirEntry]] = []
+        try:
+            with os.scandir(root_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(executor.submit(_list_wav_entries, entry.path))
+                    elif entry.name.lower().endswith('.wav'):
+                        pending.append(entry)
+        except PermissionError as e:
+            # Same handling as the serial walk in _iter_wav_entries
+            print(f"Warning: Skipping unreadable directory {root_dir}: {e}")
+        
+        wav_entries: List[os.DirEntry] = []
+        for item in pending:
+            if isinstance(item, Future):
+                wav_entries.extend(item.result())
+            else:
+                wav_entries.append(item)
+    
+    return wav_entries
+
+
+def find_wav_entries(
+    root_dir: Path,
+    filter_terms: List[str] = None,
+    max_workers: Optional[int] = None
+) -> List[os.DirEntry]:
+    """
+    Recursively find WAV file directory entries, optionally filtered by terms.
+    
+    The returned os.DirEntry objects carry the path and a (platform-cached)
+    stat() result, so callers don't need to stat each file a second time.
     
     Args:
         root_dir: Root directory to search in
         filter_terms: List of substrings to filter filenames by (case-insensitive).
                      If None or empty, no filtering is applied.
+        max_workers: Number of directory scanner threads (see _scan_wav_entries)
         
     Returns:
-        List of Path objects for each matching WAV file found
+        List of os.DirEntry objects for each matching WAV file found
     """
     if not root_dir.exists():
         raise FileNotFoundError(f"Root directory not found: {root_dir}")
     
     print(f"Searching for WAV files in: {root_dir}")
     
-    # Get all WAV files (case-insensitive search)
-    wav_files = []
-    for pattern in ['*.wav', '*.WAV']:
-        wav_files.extend(root_dir.rglob(pattern))
+    # Get all WAV files (case-insensitive search) in a single directory walk; a
+    # root that is a file rather than a directory contains no WAV files
+    if root_dir.is_dir():
+        wav_entries = _scan_wav_entries(root_dir, max_workers)
+    else:
+        wav_entries = []
     
-    print(f"Found {len(wav_files)} total WAV files")
+    print(f"Found {len(wav_entries)} total WAV files")
     
     # Apply filters if any terms are provided
     if filter_terms:
         filter_terms = [term.lower() for term in filter_terms]
-        filtered_files = [
-            f for f in wav_files
-            if any(term in str(f).lower() for term in filter_terms)
+        # Lowercase each path once and match all terms in one regex scan, with
+        # duplicate terms dropped and the most common terms tried first
+        pattern_terms = sorted(
+            dict.fromkeys(filter_terms),
+            key=lambda term: -_FILTER_TERM_FREQUENCY.get(term, 0)
+        )
+        filter_pattern = re.compile('|'.join(map(re.escape, pattern_terms)))
+        filtered_entries = [
+            entry for entry in wav_entries
+            if filter_pattern.search(entry.path.lower())
         ]
-        print(f"After filtering for terms {filter_terms}: {len(filtered_files)} files")
-        return filtered_files
+        print(f"After filtering for terms {filter_terms}: {len(filtered_entries)} files")
+        return filtered_entries
         
-    return wav_files
+    return wav_entries
+
+
+def find_wav_files(
+    root_dir: Path,
+    filter_terms: List[str] = None,
+    max_workers: Optional[int] = None
+) -> List[Path]:
+    """
+    Recursively find WAV files in the specified directory, optionally filtered by terms.
+    
+    Args:
+        root_dir: Root directory to search in
+        filter_terms: List of substrings to filter filenames by (case-insensitive).
+                     If None or empty, no filtering is applied.
+        max_workers: Number of directory scanner threads (see _scan_wav_entries)
+        
+    Returns:
+        List of Path objects for each matching WAV file found
+    """
+    return [Path(entry.path) for entry in find_wav_entries(root_dir, filter_terms, max_workers)]
 
 
-def determine_drone_type(file_path: Path) -> DroneType:
+def determine_drone_type(file_path: Union[str, Path]) -> DroneType:
     """
     Determine the drone type based on the file path.
     
     This function uses the normalize_drone_type function to handle
-    legacy misspellings like "membo" -> "mambo".
+    legacy misspellings like "membo" -> "mambo". Passing the path as a
+    string (e.g. os.DirEntry.path) avoids a Path-to-str conversion per file.
     """
-    file_str = str(file_path).lower()
+    file_str = os.fspath(file_path).lower()
     
-    if 'bebop' in file_str:
-        return DroneType.BEBOP
-    elif 'membo' in file_str or 'mambo' in file_str:
-        # This will automatically correct "membo" to "mambo"
-        detected_name = 'membo' if 'membo' in file_str else 'mambo'
-        return normalize_drone_type(detected_name)
-    else:
-        # Default to BEBOP if no clear match (shouldn't happen with proper filtering)
-        print(f"Warning: Could not determine drone type for {file_path}, defaulting to BEBOP")
-        return DroneType.BEBOP
+    # Tokens are checked in priority order; normalize_drone_type is cached, and
+    # will automatically correct "membo" to "mambo"
+    for token in _DRONE_TYPE_TOKENS:
+        if token in file_str:
+            return normalize_drone_type(token)
+    
+    # Default to BEBOP if no clear match (shouldn't happen with proper filtering)
+    print(f"Warning: Could not determine drone type for {file_path}, defaulting to BEBOP")
+    return DroneType.BEBOP
 
 
 def main():
     """Main function to execute the script."""
+    # CLI-only dependencies are imported here rather than at module import time
+    import yaml
+    from dotenv import load_dotenv
+    
     try:
         # Load environment variables
         load_dotenv()
@@ -170,10 +289,28 @@ Refer to: {config.get('data_lake', {}).get('root_dir_info', 'No info available')
             """)
             sys.exit(1)
         
+        # Resolve once so every scanned file path is already absolute
+        root_dir = root_dir.resolve()
+        
+        # Number of directory scanner threads (optional, e.g. 1 for a local SSD)
+        scan_parallelism = os.getenv('SCAN_PARALLELISM')
+        max_workers = None
+        if scan_parallelism:
+            try:
+                max_workers = int(scan_parallelism)
+            except ValueError:
+                print(
+                    "Error: SCAN_PARALLELISM must be a whole number of threads, "
+                    f"got: {scan_parallelism!r}",
+                    file=sys.stderr
+                )
+                sys.exit(1)
+            print(f"Using SCAN_PARALLELISM: {max_workers}")
+        
         # Find and filter WAV files
-        wav_files = find_wav_files(root_dir, filter_terms)
+        wav_entries = find_wav_entries(root_dir, filter_terms, max_workers)
         
-        if not wav_files:
+        if not wav_entries:
             print(f"""
 No WAV files found matching the filter criteria.
 
@@ -196,31 +333,42 @@ Please verify:
         )
         
         # Add files to registry
-        print(f"\nProcessing {len(wav_files)} WAV files...")
-        processed_count = 0
+        print(f"\nProcessing {len(wav_entries)} WAV files...")
         error_count = 0
         
-        # Capture warnings for drone type corrections
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        # Count drone type corrections made while processing the files
+        corrections_before = get_correction_count()
+        
+        # Build all entries first, reusing the scan's stat() result, then add them
+        # in one extend(). The values come straight from the scan of the resolved
+        # root (absolute paths, known drone types), so per-entry validation is skipped.
+        new_entries = []
+        
+        # Silence the correction warning; the number of corrections is reported below
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
             
-            for file_path in wav_files:
+            for wav_entry in wav_entries:
+                file_path = wav_entry.path
                 try:
-                    drone_type = determine_drone_type(file_path)
-                    registry.add_entry(file_path, drone_type)
-                    processed_count += 1
+                    stat = wav_entry.stat()
+                    new_entries.append(CleanWavEntry.model_construct(
+                        file_path=PurePath(file_path),
+                        drone_type=determine_drone_type(file_path),
+                        file_size=stat.st_size,
+                        modified_time=stat.st_mtime
+                    ))
                 except Exception as e:
                     print(f"Warning: Could not add {file_path}: {e}")
                     error_count += 1
-            
-            # Show any drone type corrections that were made
-            corrections = [warn for warn in w if "Correcting legacy drone type" in str(warn.message)]
-            if corrections:
-                print(f"\nDrone type corrections made: {len(corrections)}")
-                for correction in corrections[:5]:  # Show first 5 corrections
-                    print(f"  {correction.message}")
-                if len(corrections) > 5:
-                    print(f"  ... and {len(corrections) - 5} more corrections")
+        
+        registry.entries.extend(new_entries)
+        processed_count = len(new_entries)
+        
+        # Show any drone type corrections that were made
+        correction_count = get_correction_count() - corrections_before
+        if correction_count:
+            print(f"\nDrone type corrections made: {correction_count}")
         
         # Print summary
         print(f"\nProcessing complete:")
@@ -239,16 +387,22 @@ Please verify:
         # Show sample of files (first 3 of each type)
         print(f"\nSample files:")
         samples = {}
+        full_types = set()
+        root_prefix = os.path.join(os.path.abspath(root_dir), '')
         for entry in registry.entries:
-            if entry.drone_type not in samples:
-                samples[entry.drone_type] = []
-            if len(samples[entry.drone_type]) < 3:
-                try:
-                    rel_path = entry.file_path.relative_to(root_dir)
-                    samples[entry.drone_type].append(rel_path)
-                except ValueError:
-                    # If relative_to fails, use the filename
-                    samples[entry.drone_type].append(entry.file_path.name)
+            type_samples = samples.setdefault(entry.drone_type, [])
+            if len(type_samples) < 3:
+                entry_path = str(entry.file_path)
+                if entry_path.startswith(root_prefix):
+                    type_samples.append(entry_path[len(root_prefix):])
+                else:
+                    # If the file is outside the root directory, use the filename
+                    type_samples.append(entry.file_path.name)
+                if len(type_samples) == 3:
+                    full_types.add(entry.drone_type)
+                    # Stop scanning once every drone type has its samples
+                    if len(full_types) == len(DroneType):
+                        break
         
         for drone_type, files in samples.items():
             print(f"\n{drone_type.value.upper()} samples:")
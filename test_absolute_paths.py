@@ -131,6 +131,7 @@ def test_path_serialization():
         root_dir=Path.cwd(),
         description="Serialization test"
     )
+    registry.add_entry(Path.cwd() / "test_setup.py", DroneType.BEBOP)
     
     # Test file-based serialization using our custom save/load methods
     test_file = Path("test_registry.json")
@@ -147,6 +148,8 @@ def test_path_serialization():
         # Check that paths are still absolute
         assert registry_loaded.header.root_dir.is_absolute(), "Deserialized root_dir should be absolute"
         assert registry_loaded.header.root_dir == registry.header.root_dir, "Paths should match after round-trip"
+        assert registry_loaded.entries[0].file_path.is_absolute(), "Deserialized file_path should be absolute"
+        assert registry_loaded == registry, "Registry should match after round-trip"
         print("✓ Absolute paths preserved through file serialization")
         
         # Show a sample of the JSON to verify format
@@ -0,0 +1,126 @@
+"""
+Test script to verify the columnar form of the clean WAV registry.
+
+This script tests:
+1. Round-trip conversion CleanWavRegistry -> CleanWavRegistryColumnar -> CleanWavRegistry
+2. JSON serialization of the columnar registry
+3. Validation of column lengths, typecodes and drone type codes
+"""
+
+from array import array
+from pathlib import Path
+
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from p05_data_models.clean_wav_registry import (
+    CleanWavRegistry,
+    CleanWavRegistryColumnar,
+    DroneType
+)
+
+
+def _make_registry():
+    """Build a small registry with entries of every drone type."""
+    registry = CleanWavRegistry.create(
+        created_by="test_columnar_registry.py",
+        filter_terms=["bebop", "mambo"],
+        root_dir=Path.cwd(),
+        description="Columnar test registry"
+    )
+    registry.add_entry(Path.cwd() / "test_setup.py", DroneType.BEBOP)
+    registry.add_entry(Path.cwd() / "WARP.md", "membo")
+    registry.add_entry(Path.cwd() / "test_absolute_paths.py", DroneType.BEBOP)
+    return registry
+
+
+def test_columnar_round_trip():
+    """Test that converting to columnar form and back preserves the registry."""
+    print("=== Testing Columnar Round Trip ===")
+    
+    registry = _make_registry()
+    columnar = CleanWavRegistryColumnar.from_registry(registry)
+    
+    assert len(columnar) == len(registry.entries), "Columnar length should match entry count"
+    assert columnar.count_by_drone_type == registry.count_by_drone_type, "Drone type counts should match"
+    assert columnar.count_by_drone_type == {DroneType.BEBOP: 2, DroneType.MAMBO: 1}
+    print("✓ Columnar counts match the registry")
+    
+    assert columnar.to_pydantic() == registry, "Registry should match after round-trip"
+    print("✓ Registry preserved through columnar round-trip")
+
+
+def test_columnar_json_round_trip():
+    """Test that the columnar registry serializes to JSON and back."""
+    print("\n=== Testing Columnar JSON Serialization ===")
+    
+    registry = _make_registry()
+    columnar = CleanWavRegistryColumnar.from_registry(registry)
+    
+    # Loaded the same way as CleanWavRegistry.load_from_file
+    columnar_loaded = CleanWavRegistryColumnar.model_validate(from_json(columnar.model_dump_json()))
+    
+    assert columnar_loaded.drone_type_codes.typecode == 'b', "Codes should load as a typed array"
+    assert columnar_loaded == columnar, "Columnar registry should match after JSON round-trip"
+    print("✓ Columnar registry preserved through JSON serialization")
+    
+    assert columnar_loaded.to_pydantic() == registry, "Registry should match after JSON round-trip"
+    print("✓ Registry preserved through columnar JSON round-trip")
+
+
+def test_columnar_validation():
+    """Test that inconsistent columns are rejected."""
+    print("\n=== Testing Columnar Validation ===")
+    
+    header = _make_registry().header
+    valid_columns = {
+        'file_paths': ["/data/a.wav", "/data/b.wav"],
+        'drone_type_codes': array('b', [0, 1]),
+        'file_sizes': array('q', [1024, 2048]),
+        'modified_times': array('d', [1.0, 2.0]),
+        'snr_db': array('d', [7.0, 7.0]),
+    }
+    CleanWavRegistryColumnar(header=header, **valid_columns)
+    
+    invalid_cases = {
+        "mismatched column length": {'drone_type_codes': array('b', [0])},
+        "wrong typecode": {'file_sizes': array('i', [1024, 2048])},
+        "unknown drone type code": {'drone_type_codes': array('b', [0, len(DroneType)])},
+        "negative drone type code": {'drone_type_codes': array('b', [0, -1])},
+        "out-of-range column value": {'drone_type_codes': [0, 200]},
+        "float in integer column": {'file_sizes': [1024, 1.5]},
+        "string in numeric column": {'modified_times': [1.0, "a"]},
+        "relative file path": {'file_paths': ["/data/a.wav", "rel/../b.wav"]},
+        "unresolved file path": {'file_paths': ["/data/a.wav", "/data/../b.wav"]},
+        "empty file path": {'file_paths': ["/data/a.wav", ""]},
+        "negative file size": {'file_sizes': array('q', [1024, -5])},
+    }
+    for description, overrides in invalid_cases.items():
+        try:
+            CleanWavRegistryColumnar(header=header, **{**valid_columns, **overrides})
+        except ValidationError:
+            print(f"✓ Rejected {description}")
+        else:
+            raise AssertionError(f"Expected a ValidationError for {description}")
+
+
+def main():
+    """Run all columnar registry tests."""
+    print("🚀 Testing Columnar Registry\n")
+    
+    try:
+        test_columnar_round_trip()
+        test_columnar_json_round_trip()
+        test_columnar_validation()
+        
+        print("\n=== Test Summary ===")
+        print("✅ All columnar registry tests passed!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,70 +10,256 @@ This script tests:
 Run this script to verify your setup is working correctly.
 """
 
+import functools
+import importlib.util
 import os
-from pathlib import Path
-from dotenv import load_dotenv
-import yaml
+import sys
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
-def test_environment_variables():
+# Config file used when TRAINING_DATA_CONFIG is not set
+_DEFAULT_CONFIG_PATH = 'config/training_data.yaml'
+
+# Top-level config sections checked (and loaded) by test_config_loading
+_CONFIG_SECTIONS = ('data_lake', 'training_data_creation', 'wav_filtering')
+_REQUIRED_SECTIONS = frozenset(_CONFIG_SECTIONS)
+
+# Fallback filter terms and root directory for the registry creation check
+_FILTER_TERMS = ("bebop", "mambo")
+_TEST_ROOT = "C:/temp/test"
+
+# Section headers printed by each check
+_HDR_ENV = "=== Testing Environment Variables ==="
+_HDR_CONFIG = "\n=== Testing Configuration Loading ==="
+_HDR_MODELS = "\n=== Testing Data Models ==="
+_HDR_DEPS = "\n=== Testing Dependencies ==="
+_HDR_SUMMARY = "\n=== Test Summary ==="
+
+# Checks that can be selected on the command line, in report order
+_CHECKS = ('deps', 'env', 'config', 'models')
+_CHECK_CHOICES = frozenset(_CHECKS + ('all',))
+
+# Summary lines (passed, failed) for each check that reports a result
+_SUMMARY_MESSAGES = {
+    'deps': ("✓ Dependencies: All required packages available",
+             "❌ Dependencies: Some packages missing"),
+    'config': ("✓ Configuration: Successfully loaded",
+               "❌ Configuration: Failed to load"),
+    'models': ("✓ Data Models: Working correctly",
+               "❌ Data Models: Issues detected"),
+}
+
+# Guards config loading when the checks run concurrently
+_config_lock = threading.Lock()
+
+
+def _write_lines(lines, out=None):
+    """
+    Write a block of output lines to stdout in a single write.
+    
+    If an out list is given, the lines are added to it instead, so a caller
+    running checks concurrently can print their output in a fixed order.
+    """
+    if out is None:
+        sys.stdout.write("\n".join(lines) + "\n")
+    else:
+        out.extend(lines)
+
+
+def _load_env(env_file):
+    """
+    Load KEY=VALUE pairs from a .env file into os.environ.
+    
+    Parsed and interpolated by python-dotenv's load_dotenv (imported only here),
+    leaving variables that are already set unchanged, as in scan_wav_files.py.
+    Unlike the bare load_dotenv() call there, only the given file is read:
+    parent directories are not searched for a .env. A missing file, or a
+    missing python-dotenv (reported by test_dependencies), is ignored.
+    """
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    
+    load_dotenv(env_file)
+
+
+def test_environment_variables(out=None):
     """Test that environment variables are loaded correctly."""
-    print("=== Testing Environment Variables ===")
+    lines = [_HDR_ENV]
     
-    load_dotenv()
+    _load_env(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'))
     
-    config_path = os.getenv('TRAINING_DATA_CONFIG', 'config/training_data.yaml')
+    config_path = os.getenv('TRAINING_DATA_CONFIG', _DEFAULT_CONFIG_PATH)
     output_path = os.getenv('CLEAN_WAV_REGISTRY_OUTPUT', 'output/clean_wav_registry.json')
     
-    print(f"✓ TRAINING_DATA_CONFIG: {config_path}")
-    print(f"✓ CLEAN_WAV_REGISTRY_OUTPUT: {output_path}")
+    lines.append(f"✓ TRAINING_DATA_CONFIG: {config_path}")
+    lines.append(f"✓ CLEAN_WAV_REGISTRY_OUTPUT: {output_path}")
     
+    _write_lines(lines, out)
     return config_path, output_path
 
 
-def test_config_loading(config_path):
-    """Test configuration file loading."""
-    print(f"\n=== Testing Configuration Loading ===")
+def _construct_sections(loader, sections):
+    """
+    Build only the given top-level sections of a YAML mapping document.
     
-    config_file = Path(config_path)
-    if not config_file.exists():
-        print(f"❌ Configuration file not found: {config_file}")
-        return None
+    The document is composed into YAML nodes, and Python objects are only
+    constructed for the values of the requested top-level keys.
+    
+    Returns:
+        Dict of the requested sections that are present, or None for an empty
+        document (as yaml.safe_load returns)
+        
+    Raises:
+        ValueError: If the document is not a mapping
+    """
+    import yaml
+    
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return None
+        if not isinstance(root, yaml.MappingNode):
+            raise ValueError(f"Expected a mapping at the top level of the configuration, got {root.tag}")
+        
+        # Expand '<<' merge keys into the mapping, as SafeConstructor.construct_mapping does
+        loader.flatten_mapping(root)
+        
+        config = {}
+        for key_node, value_node in root.value:
+            if key_node.value in sections:
+                config[key_node.value] = loader.construct_object(value_node, deep=True)
+        return config
+    finally:
+        loader.dispose()
+
+
+def _load_config(config_file):
+    """
+    Load the checked sections of a YAML config file, using a JSON sidecar
+    when it is up to date.
+    
+    The sidecar (__pycache__/<config name>.json next to the config) records the
+    config file's mtime and size and the sections it holds, and is only used
+    when all of them still match; then the config is read with the stdlib C
+    JSON parser. Configs that don't survive a JSON round trip unchanged (e.g.
+    non-string keys or dates) are never written to the sidecar.
+    """
+    import json
+    # Use the libyaml C loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as CSafeLoader
+    
+    sidecar_dir = os.path.join(os.path.dirname(config_file), '__pycache__')
+    sidecar_file = os.path.join(sidecar_dir, f"{os.path.basename(config_file)}.json")
+    
+    # Read the raw bytes with a single read() on a bare file descriptor (no
+    # buffered text wrapper); the C loader decodes the UTF-8 bytes itself
+    fd = os.open(config_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        stat = os.fstat(fd)
+        cache_key = [stat.st_mtime_ns, stat.st_size, list(_CONFIG_SECTIONS)]
+        
+        try:
+            with open(sidecar_file, 'rb') as sidecar:
+                cached = json.loads(sidecar.read())
+            if cached['key'] == cache_key:
+                return cached['config']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        data = os.read(fd, stat.st_size)
+    finally:
+        os.close(fd)
     
-    print(f"✓ Configuration file exists: {config_file}")
+    config = _construct_sections(CSafeLoader(data), _CONFIG_SECTIONS)
     
+    # The sidecar is best-effort; write atomically so readers never see a partial file
+    tmp_file = f"{sidecar_file}.tmp"
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        payload = json.dumps({'key': cache_key, 'config': config})
+        if json.loads(payload)['config'] == config:
+            os.makedirs(sidecar_dir, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as sidecar:
+                sidecar.write(payload)
+            os.replace(tmp_file, sidecar_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    
+    return config
+
+
+def _get_config(config_path):
+    """Load the config once per process and share it between the checks."""
+    # Hold the lock around the cache lookup, so concurrent first callers wait
+    # for a single load instead of each missing the cache
+    with _config_lock:
+        return _get_config_cached(config_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config_cached(config_path):
+    """Memoized _load_config; call through _get_config, which holds the lock."""
+    return _load_config(config_path)
+
+
+def test_config_loading(config_path=None, out=None):
+    """Test configuration file loading."""
+    lines = [_HDR_CONFIG]
+    
+    if config_path is None:
+        config_path = os.getenv('TRAINING_DATA_CONFIG', _DEFAULT_CONFIG_PATH)
+    config_file = os.fspath(config_path)
+    
+    try:
+        config = _get_config(config_path)
         
-        print("✓ Configuration file loaded successfully")
+        lines.append(f"✓ Configuration file exists: {config_file}")
+        if config is None:
+            raise ValueError("Configuration file is empty")
+        lines.append("✓ Configuration file loaded successfully")
         
         # Check key sections
-        sections_to_check = ['data_lake', 'training_data_creation', 'wav_filtering']
-        for section in sections_to_check:
-            if section in config:
-                print(f"✓ Section '{section}' found")
-            else:
-                print(f"⚠️  Section '{section}' missing")
+        present = _REQUIRED_SECTIONS & config.keys()
+        missing = _REQUIRED_SECTIONS - present
+        if present:
+            found = ", ".join(s for s in _CONFIG_SECTIONS if s in present)
+            lines.append(f"✓ Sections found: {found}")
+        if missing:
+            absent = ", ".join(s for s in _CONFIG_SECTIONS if s in missing)
+            lines.append(f"⚠️  Sections missing: {absent}")
         
         # Show some config values
         if 'data_lake' in config:
             root_dir = config['data_lake'].get('root_dir', 'Not specified')
-            print(f"  Root directory: {root_dir}")
+            lines.append(f"  Root directory: {root_dir}")
         
         if 'wav_filtering' in config:
             filter_terms = config['wav_filtering'].get('filter_terms', [])
-            print(f"  Filter terms: {filter_terms}")
+            lines.append(f"  Filter terms: {filter_terms}")
         
         return config
         
+    except FileNotFoundError:
+        lines.append(f"❌ Configuration file not found: {config_file}")
+        return None
     except Exception as e:
-        print(f"❌ Error loading configuration: {e}")
+        lines.append(f"❌ Error loading configuration: {e}")
         return None
+    finally:
+        _write_lines(lines, out)
 
 
-def test_data_models():
+def test_data_models(out=None):
     """Test that data models can be imported and used."""
-    print(f"\n=== Testing Data Models ===")
+    lines = [_HDR_MODELS]
     
     try:
         from p05_data_models.clean_wav_registry import (
@@ -81,38 +267,54 @@ def test_data_models():
             DroneType,
             normalize_drone_type
         )
-        print("✓ Data models imported successfully")
+        lines.append("✓ Data models imported successfully")
         
         # Test drone type correction
         test_cases = ["membo", "mambo", "bebop", "MEMBO"]
-        print("  Testing drone type corrections:")
+        lines.append("  Testing drone type corrections:")
+        
+        # Capture the correction warning so it is reported with this check's
+        # output rather than on stderr (this check may run on a worker thread)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", UserWarning)
+            
+            for test_case in test_cases:
+                try:
+                    corrected = normalize_drone_type(test_case)
+                    lines.append(f"    '{test_case}' -> {corrected.value}")
+                except Exception as e:
+                    lines.append(f"    '{test_case}' -> ERROR: {e}")
         
-        for test_case in test_cases:
-            try:
-                corrected = normalize_drone_type(test_case)
-                print(f"    '{test_case}' -> {corrected.value}")
-            except Exception as e:
-                print(f"    '{test_case}' -> ERROR: {e}")
+        for warning in caught:
+            lines.append(f"  ⚠️  {warning.message}")
+        
+        # Test registry creation, with the filter terms from the shared config
+        try:
+            config_path = os.getenv('TRAINING_DATA_CONFIG', _DEFAULT_CONFIG_PATH)
+            filter_terms = _get_config(config_path)['wav_filtering']['filter_terms']
+        except Exception:
+            filter_terms = _FILTER_TERMS
         
-        # Test registry creation
         registry = CleanWavRegistry.create(
             created_by="test_setup.py",
-            filter_terms=["bebop", "mambo"],
-            root_dir=Path("C:/temp/test"),
+            filter_terms=filter_terms,
+            root_dir=_TEST_ROOT,
             description="Test registry"
         )
-        print("✓ Registry creation successful")
+        lines.append("✓ Registry creation successful")
         
         return True
         
     except Exception as e:
-        print(f"❌ Error with data models: {e}")
+        lines.append(f"❌ Error with data models: {e}")
         return False
+    finally:
+        _write_lines(lines, out)
 
 
-def test_dependencies():
+def test_dependencies(out=None):
     """Test that all required dependencies are available."""
-    print(f"\n=== Testing Dependencies ===")
+    lines = [_HDR_DEPS]
     
     dependencies = [
         ("pydantic", "Pydantic"),
@@ -120,53 +322,90 @@ def test_dependencies():
         ("dotenv", "python-dotenv")
     ]
     
+    # find_spec only locates each package; it doesn't execute its import
     all_good = True
     for module_name, display_name in dependencies:
-        try:
-            __import__(module_name)
-            print(f"✓ {display_name} available")
-        except ImportError:
-            print(f"❌ {display_name} not available")
+        if importlib.util.find_spec(module_name) is not None:
+            lines.append(f"✓ {display_name} available")
+        else:
+            lines.append(f"❌ {display_name} not available")
             all_good = False
     
+    _write_lines(lines, out)
     return all_good
 
 
-def main():
-    """Run all tests."""
-    print("🚀 Testing Sara Al-Emadi Drones Project Setup\n")
+def _parse_checks(args):
+    """
+    Select the checks to run from command line arguments.
+    
+    Args:
+        args: Check names (see _CHECK_CHOICES); no arguments means 'all'
+        
+    Returns:
+        Tuple of the selected check names, in report order
+    """
+    names = set(args) or {'all'}
+    unknown = names - _CHECK_CHOICES
+    if unknown:
+        sys.exit(
+            f"Unknown check(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(_CHECKS)}, all"
+        )
+    
+    if 'all' in names:
+        return _CHECKS
+    return tuple(name for name in _CHECKS if name in names)
+
+
+def main(args=None):
+    """
+    Run the selected tests (all of them by default).
     
-    # Test dependencies first
-    deps_ok = test_dependencies()
+    Usage: python test_setup.py [deps] [env] [config] [models] [all]
+    """
+    selected = _parse_checks(sys.argv[1:] if args is None else args)
     
-    # Test environment variables
-    config_path, output_path = test_environment_variables()
+    print("🚀 Testing Sara Al-Emadi Drones Project Setup\n")
     
-    # Test configuration loading
-    config = test_config_loading(config_path)
+    # The environment check is cheap and sets the config path the other checks
+    # use, so it always runs first (its output is shown only when selected). The
+    # remaining checks are independent and overlap (e.g. the pydantic import
+    # with the config parse); their output is collected and printed in the
+    # usual order afterwards.
+    outputs = {name: [] for name in _CHECKS}
+    config_path, output_path = test_environment_variables(outputs['env'])
     
-    # Test data models
-    models_ok = test_data_models()
+    checks = {
+        'deps': test_dependencies,
+        'config': functools.partial(test_config_loading, config_path),
+        'models': test_data_models,
+    }
     
-    # Summary
-    print(f"\n=== Test Summary ===")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            name: executor.submit(checks[name], outputs[name])
+            for name in selected if name in checks
+        }
+        results = {name: future.result() for name, future in futures.items()}
     
-    if deps_ok:
-        print("✓ Dependencies: All required packages available")
-    else:
-        print("❌ Dependencies: Some packages missing")
+    _write_lines([line for name in selected for line in outputs[name]])
     
-    if config is not None:
-        print("✓ Configuration: Successfully loaded")
-    else:
-        print("❌ Configuration: Failed to load")
+    # Summary
+    print(_HDR_SUMMARY)
     
-    if models_ok:
-        print("✓ Data Models: Working correctly")
-    else:
-        print("❌ Data Models: Issues detected")
+    # test_config_loading returns the config (None on failure), the others a bool
+    passed = {
+        name: result is not None if name == 'config' else bool(result)
+        for name, result in results.items()
+    }
+    for name, ok in passed.items():
+        ok_message, failed_message = _SUMMARY_MESSAGES[name]
+        print(ok_message if ok else failed_message)
     
-    if deps_ok and config is not None and models_ok:
+    if not passed:
+        print("No pass/fail checks were selected.")
+    elif all(passed.values()):
         print("\n🎉 All tests passed! Your setup is ready.")
         print(f"You can now run: python scan_wav_files.py")
         print(f"(Make sure to update the root_dir in {config_path} first)")